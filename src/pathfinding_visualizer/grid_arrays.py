@@ -0,0 +1,18 @@
+"""Flat array views of the grid.
+
+The search kernels in grid_search work on plain arrays indexed by
+row * cols + col instead of the nested list of vertices. These helpers
+build such arrays from the grid, and map indices back to vertices so the
+result of a search can be animated.
+"""
+from vertex import Vertex
+
+
+def flatten(grid: list[list[Vertex]]) -> list[Vertex]:
+    """Returns the vertices of the grid ordered by their index."""
+    return [vertex for row in grid for vertex in row]
+
+
+def walls(grid: list[list[Vertex]]) -> bytearray:
+    """Returns a flattened grid in which a non-zero entry marks a wall."""
+    return bytearray(vertex.is_wall() for row in grid for vertex in row)
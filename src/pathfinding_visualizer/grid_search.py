@@ -0,0 +1,64 @@
+"""Visualization-free pathfinding on a flattened grid.
+
+The grid is represented by a bytearray of walls indexed by row * cols + col.
+Searching it does not touch any Vertex objects or the interface, so the
+shortest path is computed first and animated afterwards.
+"""
+from heapq import heappop, heappush
+from utils import INF
+
+
+def a_star_grid(walls: bytearray, rows: int, cols: int, start: int, destination: int) -> list[int]:
+    """Runs A* search on a grid of walls.
+
+    Args:
+        walls: Flattened grid in which a non-zero entry marks a wall.
+        rows: The number of rows of the grid.
+        cols: The number of columns of the grid.
+        start: Index of the start vertex.
+        destination: Index of the destination vertex.
+
+    Returns:
+        The indices of the shortest path from start to destination,
+        or an empty list if the destination cannot be reached.
+    """
+    dx, dy = divmod(destination, cols)
+    came_from = [-1] * (rows * cols)
+    g_score = [INF] * (rows * cols)
+    g_score[start] = 0
+    sx, sy = divmod(start, cols)
+    queue = [(abs(sx - dx) + abs(sy - dy), start)]
+
+    while queue:
+        score, current = heappop(queue)
+
+        if current == destination:
+            path = [current]
+            while current != start:
+                current = came_from[current]
+                path.append(current)
+            path.reverse()
+            return path
+
+        x, y = divmod(current, cols)
+
+        # Skip stale entries (lazy deletion)
+        if score > g_score[current] + abs(x - dx) + abs(y - dy):
+            continue
+
+        new_g_score = g_score[current] + 1
+        for neighbor, nx, ny in (
+            (current + cols, x + 1, y),
+            (current - cols, x - 1, y),
+            (current + 1, x, y + 1),
+            (current - 1, x, y - 1),
+        ):
+            if not (0 <= nx < rows and 0 <= ny < cols) or walls[neighbor]:
+                continue
+
+            if new_g_score < g_score[neighbor]:
+                came_from[neighbor] = current
+                g_score[neighbor] = new_g_score
+                heappush(queue, (new_g_score + abs(nx - dx) + abs(ny - dy), neighbor))
+
+    return []
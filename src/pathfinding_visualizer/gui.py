@@ -10,9 +10,10 @@ The GUI handles mouse and keyboard events such as:
 - Press 3 to visualize Bidirectional search
 - Press 4 to visualize Breadth-first search
 - Press 5 to visualize Depth-first search
+- Press 6 to find the shortest path with A* search without visualization
 """
 import pygame
-from random import randrange
+from random import sample
 from pathfinder import Pathfinder
 from vertex import Vertex
 from utils import Algorithms, Colors
@@ -28,6 +29,8 @@ class GUI:
         _cols: The number of columns of the grid.
         _width: The width of the interface.
         _window: The graphical user interface.
+        _grid_lines: Transparent surface holding the grid lines.
+        _dirty: Vertices whose state changed since the last draw.
     """
 
     def __init__(self, rows: int = 50, width: int = 700) -> None:
@@ -49,6 +52,10 @@ class GUI:
         self._cols = rows
         self._width = width
         self._window = pygame.display.set_mode((width, width))
+        self._grid_lines = pygame.Surface((width, width), pygame.SRCALPHA)
+        self._dirty = []
+
+        self._draw_lines(self._grid_lines)
 
         pygame.display.set_caption("Pathfinding Visualizer")
 
@@ -58,7 +65,7 @@ class GUI:
         for row in range(self._rows):
             grid.append([])
             for col in range(self._cols):
-                grid[row].append(Vertex(row, col, self._gap, self._rows))
+                grid[row].append(Vertex(row, col, self._gap, self._rows, self))
 
         return grid
 
@@ -71,13 +78,12 @@ class GUI:
     ) -> list[list[Vertex]]:
         """Generates a random maze."""
         self._reset_vertices(grid, True)
-        n = round(len(grid) * len(grid) * threshold)
+        n = round(self._rows * self._cols * threshold)
 
-        for _ in range(n + 1):
-            row = randrange(len(grid))
-            col = randrange(len(grid))
-            if grid[row][col] != start and grid[row][col] != destination:
-                grid[row][col].make_wall()
+        for index in sample(range(self._rows * self._cols), n):
+            vertex = grid[index // self._cols][index % self._cols]
+            if vertex != start and vertex != destination:
+                vertex.make_wall()
 
     def draw(self, grid: list[list[Vertex]]) -> None:
         """Draws the vertices."""
@@ -85,14 +91,31 @@ class GUI:
             for vertex in row:
                 vertex.draw(self._window)
 
-        self._draw_lines()
+        self._window.blit(self._grid_lines, (0, 0))
+        self._dirty.clear()
         pygame.display.update()
 
-    def _draw_lines(self) -> None:
-        """Draws the grid lines."""
+    def mark_dirty(self, vertex: Vertex) -> None:
+        """Marks a vertex to be redrawn by the next call of draw_dirty."""
+        self._dirty.append(vertex)
+
+    def draw_dirty(self) -> None:
+        """Draws only the vertices whose state changed since the last draw."""
+        rects = []
+        for vertex in self._dirty:
+            vertex.draw(self._window)
+            rect = vertex.get_rect()
+            self._window.blit(self._grid_lines, rect, rect)
+            rects.append(rect)
+
+        self._dirty.clear()
+        pygame.display.update(rects)
+
+    def _draw_lines(self, surface: pygame.Surface) -> None:
+        """Draws the grid lines onto a surface."""
         for i in range(self._rows):
-            pygame.draw.line(self._window, Colors.LIGHT_BLUE, (0, i * self._gap), (self._width, i * self._gap))
-            pygame.draw.line(self._window, Colors.LIGHT_BLUE, (i * self._gap, 0), (i * self._gap, self._width))
+            pygame.draw.line(surface, Colors.LIGHT_BLUE, (0, i * self._gap), (self._width, i * self._gap))
+            pygame.draw.line(surface, Colors.LIGHT_BLUE, (i * self._gap, 0), (i * self._gap, self._width))
 
     def _get_clicked_position(self, position: tuple[int, int]) -> tuple[int, int]:
         """Gets the clicked position."""
@@ -163,6 +186,7 @@ class GUI:
         start: Vertex,
         destination: Vertex,
         algorithm: Algorithms,
+        fast: bool = False,
     ) -> None:
         """Visualizes a pathfinding algorithm."""
         self._reset_vertices(grid)
@@ -171,7 +195,7 @@ class GUI:
         if algorithm == Algorithms.DIJKTRA:
             self._pathfinder.dijkstra(self, grid, start, destination)
         elif algorithm == Algorithms.A_STAR_SEARCH:
-            self._pathfinder.a_star_search(self, grid, start, destination)
+            self._pathfinder.a_star_search(self, grid, start, destination, fast)
         elif algorithm == Algorithms.BIDIRECTIONAL_SEARCH:
             self._pathfinder.bidirectional_search(self, grid, start, destination)
         elif algorithm == Algorithms.BREADTH_FIRST_SEARCH:
@@ -223,6 +247,10 @@ class GUI:
                     elif event.key == pygame.K_5 and start and destination:
                         self._visualize_algorithm(grid, start, destination, Algorithms.DEPTH_FIRST_SEARCH)
 
+                    # A* search without visualization
+                    elif event.key == pygame.K_6 and start and destination:
+                        self._visualize_algorithm(grid, start, destination, Algorithms.A_STAR_SEARCH, True)
+
                     # Generate maze
                     elif event.key == pygame.K_m:
                         self._generate_maze(grid, start, destination)
@@ -9,9 +9,15 @@ a path from start to destination can be found using these algorithms:
 - Depth-first search
 """
 import pygame
-from queue import PriorityQueue, deque
+from heapq import heappop, heappush
+from queue import deque
+from grid_arrays import flatten, walls
+from grid_search import a_star_grid
 from vertex import Vertex
-from utils import AStarSearch, BidirectionalSearch, Path
+from utils import INF, BidirectionalSearch, Path
+
+# Number of vertex expansions between two redraws of the grid
+DRAW_INTERVAL = 32
 
 
 class Pathfinder:
@@ -20,86 +26,123 @@ class Pathfinder:
     def dijkstra(self, gui: object, grid: list[list[Vertex]], start: Vertex, destination: Vertex) -> bool:
         """Visualizes Dijkstra's algorithm."""
         count = 0
-        queue = PriorityQueue()
-        queue.put((0, count, start))
-        visited = {start}
-        came_from = {}
-        costs = {vertex: float('inf') for row in grid for vertex in row}
-        costs[start] = 0
-
-        while not queue.empty():
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
+        step = 0
+        queue = []
+        heappush(queue, (0, count, start))
+        came_from = [-1] * (len(grid) * len(grid[0]))
+        costs = [INF] * (len(grid) * len(grid[0]))
+        costs[start.index] = 0
 
-            current = queue.get()[2]
-            visited.add(current)
+        while queue:
+            cost, _, current = heappop(queue)
+
+            # Skip stale entries (lazy deletion)
+            if cost > costs[current.index]:
+                continue
 
-            if current == destination:
-                Path.reconstruct(gui, grid, came_from, destination)
+            if current is destination:
+                Path.reconstruct(gui, flatten(grid), came_from, destination)
                 start.make_start()
                 return True
 
+            new_cost = costs[current.index] + 1
             for neighbor in current.neighbors:
-                new_cost = costs[current] + 1
-                if new_cost < costs[neighbor]:
-                    came_from[neighbor] = current
-                    costs[neighbor] = new_cost
-                    if neighbor not in visited:
-                        count += 1
-                        queue.put((costs[neighbor], count, neighbor))
-                        visited.add(neighbor)
-
-            if current != start:
+                if new_cost < costs[neighbor.index]:
+                    came_from[neighbor.index] = current.index
+                    costs[neighbor.index] = new_cost
+                    count += 1
+                    heappush(queue, (new_cost, count, neighbor))
+
+            if current is not start:
                 current.make_visited()
 
-            gui.draw(grid)
+            step += 1
+            if step % DRAW_INTERVAL == 0:
+                # Leave a quit request in the queue for the main loop to handle
+                if pygame.event.peek(pygame.QUIT):
+                    return False
 
+                pygame.event.clear()
+                gui.draw_dirty()
+
+        gui.draw_dirty()
         return False
 
-    def a_star_search(self, gui: object, grid: list[list[Vertex]], start: Vertex, destination: Vertex) -> bool:
-        """Visualizes A* search."""
+    def a_star_search(
+        self,
+        gui: object,
+        grid: list[list[Vertex]],
+        start: Vertex,
+        destination: Vertex,
+        fast: bool = False,
+    ) -> bool:
+        """Visualizes A* search.
+
+        If fast is set, the search runs on a flattened grid of walls
+        and only the resulting shortest path is animated.
+        """
+        if fast:
+            return self._a_star_search_fast(gui, grid, start, destination)
+
         count = 0
-        queue = PriorityQueue()
-        queue.put((0, count, start))
-        visited = {start}
-        came_from = {}
-        g_score = {vertex: float('inf') for row in grid for vertex in row}
-        g_score[start] = 0
-        f_score = {vertex: float('inf') for row in grid for vertex in row}
-        f_score[start] = AStarSearch.manhatten_distance(start, destination)
-
-        while not queue.empty():
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
+        step = 0
+        queue = []
+        heappush(queue, (0, count, start))
+        came_from = [-1] * (len(grid) * len(grid[0]))
+        g_score = [INF] * (len(grid) * len(grid[0]))
+        g_score[start.index] = 0
+        f_score = [INF] * (len(grid) * len(grid[0]))
+        dx, dy = destination.get_position()
+        sx, sy = start.get_position()
+        f_score[start.index] = abs(sx - dx) + abs(sy - dy)
+
+        while queue:
+            score, _, current = heappop(queue)
 
-            current = queue.get()[2]
-            visited.add(current)
+            # Skip stale entries (lazy deletion)
+            if score > f_score[current.index]:
+                continue
 
-            if current == destination:
-                Path.reconstruct(gui, grid, came_from, destination)
+            if current is destination:
+                Path.reconstruct(gui, flatten(grid), came_from, destination)
                 start.make_start()
                 return True
 
-            for neighbor in current.neighbors:
-                new_g_score = g_score[current] + 1
-                if new_g_score < g_score[neighbor]:
-                    came_from[neighbor] = current
-                    g_score[neighbor] = new_g_score
-                    f_score[neighbor] = new_g_score + AStarSearch.manhatten_distance(neighbor, destination)
-                    if neighbor not in visited:
-                        count += 1
-                        queue.put((f_score[neighbor], count, neighbor))
-                        visited.add(neighbor)
-
-            if current != start:
+            new_g_score = g_score[current.index] + 1
+            for neighbor, index, row, col in current.neighbor_info:
+                if new_g_score < g_score[index]:
+                    came_from[index] = current.index
+                    g_score[index] = new_g_score
+                    f_score[index] = new_g_score + abs(row - dx) + abs(col - dy)
+                    count += 1
+                    heappush(queue, (f_score[index], count, neighbor))
+
+            if current is not start:
                 current.make_visited()
 
-            gui.draw(grid)
+            step += 1
+            if step % DRAW_INTERVAL == 0:
+                # Leave a quit request in the queue for the main loop to handle
+                if pygame.event.peek(pygame.QUIT):
+                    return False
+
+                pygame.event.clear()
+                gui.draw_dirty()
 
+        gui.draw_dirty()
         return False
 
+    def _a_star_search_fast(self, gui: object, grid: list[list[Vertex]], start: Vertex, destination: Vertex) -> bool:
+        """Runs A* search without visualization and draws the shortest path."""
+        vertices = flatten(grid)
+        path = a_star_grid(walls(grid), len(grid), len(grid[0]), start.index, destination.index)
+
+        for index in path[1:-1]:
+            vertices[index].make_path()
+
+        gui.draw_dirty()
+        return bool(path)
+
     def bidirectional_search(self, gui: object, grid: list[list[Vertex]], start: Vertex, destination: Vertex) -> bool:
         """Visualizes bidirectional search."""
         queue_src = deque()
@@ -127,44 +170,54 @@ class Pathfinder:
         return False
 
     def breadth_first_search(self, gui: object, grid: list[list[Vertex]], start: Vertex, destination: Vertex) -> bool:
-        """Visualizes breadth-first search."""
+        """Visualizes breadth-first search.
+
+        Every edge of the grid has weight 1, so breadth-first search finds
+        the same shortest paths as Dijkstra's algorithm in O(V + E) time.
+        """
+        step = 0
         queue = deque()
         queue.append(start)
-        visited = {start}
-        came_from = {}
+        visited = bytearray(len(grid) * len(grid[0]))
+        visited[start.index] = 1
+        came_from = [-1] * (len(grid) * len(grid[0]))
 
         while queue:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-
             current = queue.popleft()
-            visited.add(current)
 
-            if current == destination:
-                Path.reconstruct(gui, grid, came_from, destination)
+            if current is destination:
+                Path.reconstruct(gui, flatten(grid), came_from, destination)
                 start.make_start()
                 return True
 
             for neighbor in current.neighbors:
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    came_from[neighbor] = current
+                if not visited[neighbor.index]:
+                    visited[neighbor.index] = 1
+                    came_from[neighbor.index] = current.index
                     queue.append(neighbor)
 
-            if current != start:
+            if current is not start:
                 current.make_visited()
 
-            gui.draw(grid)
+            step += 1
+            if step % DRAW_INTERVAL == 0:
+                # Leave a quit request in the queue for the main loop to handle
+                if pygame.event.peek(pygame.QUIT):
+                    return False
+
+                pygame.event.clear()
+                gui.draw_dirty()
 
+        gui.draw_dirty()
         return False
 
     def depth_first_search(self, gui: object, grid: list[list[Vertex]], start: Vertex, destination: Vertex) -> bool:
         """Visualizes depth-first search."""
         stack = []
         stack.append(start)
-        visited = {start}
-        came_from = {}
+        visited = bytearray(len(grid) * len(grid[0]))
+        visited[start.index] = 1
+        came_from = [-1] * (len(grid) * len(grid[0]))
 
         while stack:
             for event in pygame.event.get():
@@ -172,22 +225,21 @@ class Pathfinder:
                     pygame.quit()
 
             current = stack.pop()
-            visited.add(current)
 
-            if current == destination:
-                Path.reconstruct(gui, grid, came_from, destination)
+            if current is destination:
+                Path.reconstruct(gui, flatten(grid), came_from, destination)
                 start.make_start()
                 return True
 
             for neighbor in current.neighbors:
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    came_from[neighbor] = current
+                if not visited[neighbor.index]:
+                    visited[neighbor.index] = 1
+                    came_from[neighbor.index] = current.index
                     stack.append(neighbor)
 
-            if current != start:
+            if current is not start:
                 current.make_visited()
 
-            gui.draw(grid)
+            gui.draw_dirty()
 
         return False
@@ -3,6 +3,9 @@ from __future__ import annotations
 from enum import Enum, auto
 from queue import deque
 
+# Cost of a vertex which has not been reached yet, larger than any path on the grid
+INF = 1 << 30
+
 
 class Algorithms(Enum):
     DIJKTRA = auto()
@@ -28,16 +31,21 @@ class Path:
     @staticmethod
     def reconstruct(
         gui: object,
-        grid: list[list[object]],
-        came_from: dict[object, object],
+        vertices: list[object],
+        came_from: list[int],
         destination: object,
     ) -> None:
-        """Reconstructs the shortest path."""
-        current = destination
-        while current in came_from:
+        """Reconstructs the shortest path.
+
+        came_from holds the index of the predecessor of each vertex,
+        or -1 if the vertex has none.
+        """
+        current = destination.index
+        while came_from[current] != -1:
             current = came_from[current]
-            current.make_path()
-            gui.draw(grid)
+            vertices[current].make_path()
+
+        gui.draw_dirty()
 
     @staticmethod
     def reconstruct_bidirectional(
@@ -62,17 +70,6 @@ class Path:
             gui.draw(grid)
 
 
-class AStarSearch:
-    """Helper class for visualizing A* search."""
-
-    @staticmethod
-    def manhatten_distance(current: object, destination: object) -> int:
-        """Computes the manhatten distance to the destination."""
-        x1, y1 = current.get_position()
-        x2, y2 = destination.get_position()
-        return abs(x1 - x2) + abs(y1 - y2)
-
-
 class BidirectionalSearch:
     """Helper class for visualizing bidirectional search."""
 
@@ -95,10 +92,10 @@ class BidirectionalSearch:
                 came_from[neighbor] = current
                 queue.append(neighbor)
 
-        if current != goal:
+        if current is not goal:
             current.make_visited()
 
-        gui.draw(grid)
+        gui.draw_dirty()
 
     @staticmethod
     def is_intersecting(visited_src: set[object], visited_dst: set[object]) -> set[object] | int:
@@ -22,6 +22,8 @@ class Vertex:
 
     Attributes:
         neighbors: Neighbors of the vertex.
+        neighbor_info: Tuples of each neighbor with its index, row and column.
+        index: Position of the vertex in the flattened grid.
         _color: Color of the vertex indicates its state.
         _row: Row of the vertex.
         _col: Column of the vertex.
@@ -29,10 +31,27 @@ class Vertex:
         _y: y coordinate of the vertex.
         _width: Width of the vertex.
         _total_rows: Total rows of the grid.
+        _gui: The interface which redraws the vertex when its state changes.
     """
 
-    def __init__(self, row: int, col: int, width: int, total_rows: int) -> None:
-        self.neighbors = []
+    __slots__ = (
+        'neighbors',
+        'neighbor_info',
+        'index',
+        '_color',
+        '_row',
+        '_col',
+        '_x',
+        '_y',
+        '_width',
+        '_total_rows',
+        '_gui',
+    )
+
+    def __init__(self, row: int, col: int, width: int, total_rows: int, gui: object) -> None:
+        self.neighbors = ()
+        self.neighbor_info = ()
+        self.index = row * total_rows + col
         self._color = Colors.WHITE
         self._row = row
         self._col = col
@@ -40,6 +59,7 @@ class Vertex:
         self._y = col * width
         self._width = width
         self._total_rows = total_rows
+        self._gui = gui
 
     def get_position(self) -> tuple[int, int]:
         """Returns the position of the vertex."""
@@ -60,26 +80,36 @@ class Vertex:
     def reset_vertex(self) -> None:
         """Resets the vertex by coloring it white."""
         self._color = Colors.WHITE
+        self._gui.mark_dirty(self)
 
     def make_start(self) -> None:
         """Colors the vertex green if it's the start."""
         self._color = Colors.GREEN
+        self._gui.mark_dirty(self)
 
     def make_destination(self) -> None:
         """Colors the vertex red if it's the destination."""
         self._color = Colors.RED
+        self._gui.mark_dirty(self)
 
     def make_visited(self) -> None:
         """Colors the vertex blue if the algorithm has visited it."""
         self._color = Colors.BLUE
+        self._gui.mark_dirty(self)
 
     def make_wall(self) -> None:
         """Colors the vertex black if it's a wall."""
         self._color = Colors.BLACK
+        self._gui.mark_dirty(self)
 
     def make_path(self) -> None:
         """Colors the vertex yellow if it belongs to the shortest path."""
         self._color = Colors.YELLOW
+        self._gui.mark_dirty(self)
+
+    def get_rect(self) -> pygame.Rect:
+        """Returns the area the vertex covers in the window."""
+        return pygame.Rect(self._x, self._y, self._width, self._width)
 
     def draw(self, window: pygame.display) -> None:
         """Draws the vertex."""
@@ -87,23 +117,26 @@ class Vertex:
 
     def update_neighbors(self, grid: list[list[Vertex]]) -> None:
         """Updates all neighbors of a vertex."""
-        self.neighbors = []
+        neighbors = []
 
         # Vertex below
         if self._row < self._total_rows - 1 and not grid[self._row + 1][self._col].is_wall():
-            self.neighbors.append(grid[self._row + 1][self._col])
+            neighbors.append(grid[self._row + 1][self._col])
 
         # Vertex above
         if self._row > 0 and not grid[self._row - 1][self._col].is_wall():
-            self.neighbors.append(grid[self._row - 1][self._col])
+            neighbors.append(grid[self._row - 1][self._col])
 
         # Vertex to the right
         if self._col < self._total_rows - 1 and not grid[self._row][self._col + 1].is_wall():
-            self.neighbors.append(grid[self._row][self._col + 1])
+            neighbors.append(grid[self._row][self._col + 1])
 
         # Vertex to the left
         if self._col > 0 and not grid[self._row][self._col - 1].is_wall():
-            self.neighbors.append(grid[self._row][self._col - 1])
+            neighbors.append(grid[self._row][self._col - 1])
+
+        self.neighbors = tuple(neighbors)
+        self.neighbor_info = tuple((neighbor, neighbor.index, *neighbor.get_position()) for neighbor in neighbors)
 
     def __lt__(self, other: Vertex) -> bool:
         return False